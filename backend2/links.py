@@ -0,0 +1,44 @@
+import hashlib
+from urllib.parse import urlparse, urlunparse
+
+
+# Hosts that all resolve to the same Telegram entity
+TELEGRAM_HOSTS = {'t.me', 'telegram.me', 'telegram.dog'}
+
+
+def normalize_link(link):
+    """
+    Canonical form of a campaign/partner link so equal targets compare equal:
+    scheme and "www." are dropped, the host is lowercased, trailing slashes are removed,
+    and Telegram links collapse onto t.me with a lowercased path (usernames are case-insensitive).
+    """
+    if not link:
+        return None
+    link = link.strip()
+    if '://' not in link:
+        link = 'https://' + link
+    parsed = urlparse(link)
+    host = (parsed.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    path = parsed.path.rstrip('/')
+    if host in TELEGRAM_HOSTS:
+        host = 't.me'
+        path = path.lower()
+    return urlunparse(('', host, path, '', parsed.query, '')).lstrip('/')
+
+
+def link_hash(link):
+    """Hex SHA-1 of normalize_link(link); stored in indexed link_hash columns for joins."""
+    normalized = normalize_link(link)
+    if normalized is None:
+        return None
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+def link_host(link):
+    """Hostname of `link` as written (None when it has none or does not parse)."""
+    try:
+        return urlparse(link).hostname if link else None
+    except ValueError:
+        return None
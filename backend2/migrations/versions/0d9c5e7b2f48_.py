@@ -0,0 +1,33 @@
+"""normalized, indexed promo code column
+
+Revision ID: 0d9c5e7b2f48
+Revises: f1b6d83e4a20
+Create Date: 2026-10-18 16:20:14.075529
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0d9c5e7b2f48'
+down_revision = 'f1b6d83e4a20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('promo_codes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('code_normalized', sa.String(length=64), nullable=True))
+
+    op.execute("UPDATE promo_codes SET code_normalized = LOWER(TRIM(code))")
+
+    with op.batch_alter_table('promo_codes', schema=None) as batch_op:
+        batch_op.alter_column('code_normalized', existing_type=sa.String(length=64), nullable=False)
+        batch_op.create_index(batch_op.f('ix_promo_codes_code_normalized'), ['code_normalized'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('promo_codes', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_promo_codes_code_normalized'))
+        batch_op.drop_column('code_normalized')
@@ -0,0 +1,59 @@
+"""denormalized display_host and reward_per_completion on user_campaigns
+
+Revision ID: 4c7a1e9d2b56
+Revises: b62e0f3a8d19
+Create Date: 2026-10-18 17:41:05.163820
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+from links import link_host
+
+
+# revision identifiers, used by Alembic.
+revision = '4c7a1e9d2b56'
+down_revision = 'b62e0f3a8d19'
+branch_labels = None
+depends_on = None
+
+
+# app.CONVERSION_RATE / GAME_REWARD_SHARE at the time of writing
+DEFAULT_CONVERSION_RATE = 1000
+GAME_REWARD_SHARE = 0.4
+
+
+def upgrade():
+    with op.batch_alter_table('user_campaigns', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('display_host', sa.String(length=255), nullable=True))
+        batch_op.add_column(sa.Column('reward_per_completion', sa.Float(), nullable=True))
+        batch_op.create_index('ix_user_campaigns_type_status_created', ['campaign_type', 'status', 'created_at'], unique=False)
+
+    bind = op.get_bind()
+    stored = bind.execute(sa.text("SELECT value FROM system_settings WHERE key = 'CONVERSION_RATE'")).scalar()
+    conv = float(json.loads(stored)) if stored else DEFAULT_CONVERSION_RATE
+
+    t = sa.table('user_campaigns', sa.column('id', sa.Integer), sa.column('link', sa.String),
+                 sa.column('goal', sa.Integer), sa.column('cost', sa.Float),
+                 sa.column('display_host', sa.String), sa.column('reward_per_completion', sa.Float))
+    rows = bind.execute(sa.select(t.c.id, t.c.link, t.c.goal, t.c.cost)).fetchall()
+    updates = [{
+        'row_id': row.id,
+        'host': link_host(row.link),
+        'reward': (float(row.cost or 0) / float(row.goal or 1)) * GAME_REWARD_SHARE * conv,
+    } for row in rows]
+    if updates:
+        bind.execute(
+            t.update().where(t.c.id == sa.bindparam('row_id'))
+            .values(display_host=sa.bindparam('host'), reward_per_completion=sa.bindparam('reward')),
+            updates
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('user_campaigns', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_campaigns_type_status_created')
+        batch_op.drop_column('reward_per_completion')
+        batch_op.drop_column('display_host')
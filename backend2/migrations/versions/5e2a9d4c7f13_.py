@@ -0,0 +1,42 @@
+"""stats_counters table for dashboard totals
+
+Revision ID: 5e2a9d4c7f13
+Revises: c3f81a6e0b27
+Create Date: 2026-10-18 14:22:40.118653
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e2a9d4c7f13'
+down_revision = 'c3f81a6e0b27'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('stats_counters',
+    sa.Column('shard', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('total_users', sa.Integer(), nullable=False),
+    sa.Column('total_coins', sa.Float(), nullable=False),
+    sa.Column('total_withdrawals', sa.Float(), nullable=False),
+    sa.Column('tasks_completed', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('shard')
+    )
+    # Seed shard 0 with the current totals (same numbers as `flask reconcile-stats`)
+    op.execute("""
+        INSERT INTO stats_counters (shard, total_users, total_coins, total_withdrawals, tasks_completed, updated_at)
+        SELECT 0,
+               (SELECT COUNT(*) FROM users),
+               (SELECT COALESCE(SUM(coins), 0) FROM users),
+               (SELECT COALESCE(SUM(amount), 0) FROM transactions WHERE type = 'Withdrawal'),
+               (SELECT COUNT(*) FROM user_daily_tasks WHERE claimed),
+               CURRENT_TIMESTAMP
+    """)
+
+
+def downgrade():
+    op.drop_table('stats_counters')
@@ -0,0 +1,26 @@
+"""index daily_tasks.active
+
+Revision ID: 6ccf6f6de3da
+Revises: 2faa8c80d73b
+Create Date: 2026-10-18 13:04:03.800340
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6ccf6f6de3da'
+down_revision = '2faa8c80d73b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('daily_tasks', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_daily_tasks_active'), ['active'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('daily_tasks', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_daily_tasks_active'))
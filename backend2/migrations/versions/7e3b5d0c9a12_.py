@@ -0,0 +1,44 @@
+"""index pack: foreign keys and status filters on hot tables
+
+Revision ID: 7e3b5d0c9a12
+Revises: 4c7a1e9d2b56
+Create Date: 2026-10-18 18:12:49.530117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7e3b5d0c9a12'
+down_revision = '4c7a1e9d2b56'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('partner_tasks', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_partner_tasks_active'), ['active'], unique=False)
+
+    with op.batch_alter_table('referrals', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_referrals_referrer_id'), ['referrer_id'], unique=False)
+
+    with op.batch_alter_table('spin_results', schema=None) as batch_op:
+        batch_op.create_index('ix_spin_results_user_spun', ['user_id', 'spun_at'], unique=False)
+
+    with op.batch_alter_table('user_campaigns', schema=None) as batch_op:
+        batch_op.create_index('ix_user_campaigns_user_created', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user_campaigns', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_campaigns_user_created')
+
+    with op.batch_alter_table('spin_results', schema=None) as batch_op:
+        batch_op.drop_index('ix_spin_results_user_spun')
+
+    with op.batch_alter_table('referrals', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_referrals_referrer_id'))
+
+    with op.batch_alter_table('partner_tasks', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_partner_tasks_active'))
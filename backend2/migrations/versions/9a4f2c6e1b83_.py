@@ -0,0 +1,26 @@
+"""user_campaigns.created_at index for the /quests listing
+
+Revision ID: 9a4f2c6e1b83
+Revises: 7e3b5d0c9a12
+Create Date: 2026-10-18 21:04:37.218604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a4f2c6e1b83'
+down_revision = '7e3b5d0c9a12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('user_campaigns', schema=None) as batch_op:
+        batch_op.create_index('ix_user_campaigns_created_at', ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('user_campaigns', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_campaigns_created_at')
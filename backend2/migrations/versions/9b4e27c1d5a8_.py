@@ -0,0 +1,47 @@
+"""normalized link_hash on partner_tasks and user_campaigns
+
+Revision ID: 9b4e27c1d5a8
+Revises: 6ccf6f6de3da
+Create Date: 2026-10-18 13:31:47.214905
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from links import link_hash
+
+
+# revision identifiers, used by Alembic.
+revision = '9b4e27c1d5a8'
+down_revision = '6ccf6f6de3da'
+branch_labels = None
+depends_on = None
+
+
+TABLES = ('partner_tasks', 'user_campaigns')
+
+
+def upgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('link_hash', sa.String(length=40), nullable=True))
+            batch_op.create_index(batch_op.f('ix_%s_link_hash' % table), ['link_hash'], unique=False)
+
+    # Backfill with the same normalization the models apply on write
+    bind = op.get_bind()
+    for table in TABLES:
+        t = sa.table(table, sa.column('id', sa.Integer), sa.column('link', sa.String), sa.column('link_hash', sa.String))
+        rows = bind.execute(sa.select(t.c.id, t.c.link).where(t.c.link.isnot(None))).fetchall()
+        updates = [{'row_id': row.id, 'hash': link_hash(row.link)} for row in rows]
+        if updates:
+            bind.execute(
+                t.update().where(t.c.id == sa.bindparam('row_id')).values(link_hash=sa.bindparam('hash')),
+                updates
+            )
+
+
+def downgrade():
+    for table in TABLES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(batch_op.f('ix_%s_link_hash' % table))
+            batch_op.drop_column('link_hash')
@@ -0,0 +1,58 @@
+"""append-only balance ledger and per-user snapshots
+
+Revision ID: a48c6f19e2d7
+Revises: e7d05b3a9c64
+Create Date: 2026-10-18 15:26:55.902114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a48c6f19e2d7'
+down_revision = 'e7d05b3a9c64'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('balance_ledger',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('coins', sa.Float(), nullable=False),
+    sa.Column('spins', sa.Integer(), nullable=False),
+    sa.Column('ton', sa.Float(), nullable=False),
+    sa.Column('ad_credit', sa.Float(), nullable=False),
+    sa.Column('reason', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('balance_ledger', schema=None) as batch_op:
+        batch_op.create_index('ix_balance_ledger_user_id_id', ['user_id', 'id'], unique=False)
+
+    op.create_table('balance_snapshots',
+    sa.Column('user_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('last_entry_id', sa.Integer(), nullable=False),
+    sa.Column('coins', sa.Float(), nullable=False),
+    sa.Column('spins', sa.Integer(), nullable=False),
+    sa.Column('ton', sa.Float(), nullable=False),
+    sa.Column('ad_credit', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # Open every existing account with its current balances so ledger sums match users
+    op.execute("""
+        INSERT INTO balance_ledger (user_id, coins, spins, ton, ad_credit, reason, created_at)
+        SELECT id, coins, spins, ton, ad_credit, 'opening', CURRENT_TIMESTAMP FROM users
+    """)
+
+
+def downgrade():
+    op.drop_table('balance_snapshots')
+    with op.batch_alter_table('balance_ledger', schema=None) as batch_op:
+        batch_op.drop_index('ix_balance_ledger_user_id_id')
+    op.drop_table('balance_ledger')
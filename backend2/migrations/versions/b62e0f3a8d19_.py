@@ -0,0 +1,27 @@
+"""users.counters_day stamp for lazily reset daily counters
+
+Revision ID: b62e0f3a8d19
+Revises: 0d9c5e7b2f48
+Create Date: 2026-10-18 16:52:37.418022
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b62e0f3a8d19'
+down_revision = '0d9c5e7b2f48'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Existing rows keep a NULL stamp, so their never-reset counters read as zero
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('counters_day', sa.Date(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('counters_day')
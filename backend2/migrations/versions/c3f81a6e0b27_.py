@@ -0,0 +1,26 @@
+"""composite index for keyset pagination of transactions
+
+Revision ID: c3f81a6e0b27
+Revises: 9b4e27c1d5a8
+Create Date: 2026-10-18 13:58:12.530217
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f81a6e0b27'
+down_revision = '9b4e27c1d5a8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.create_index('ix_transactions_user_created_id', ['user_id', 'created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('transactions', schema=None) as batch_op:
+        batch_op.drop_index('ix_transactions_user_created_id')
@@ -0,0 +1,26 @@
+"""optimistic lock version on users
+
+Revision ID: e7d05b3a9c64
+Revises: 5e2a9d4c7f13
+Create Date: 2026-10-18 14:51:09.337480
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7d05b3a9c64'
+down_revision = '5e2a9d4c7f13'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('version')
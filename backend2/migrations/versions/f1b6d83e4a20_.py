@@ -0,0 +1,31 @@
+"""uses_count counter on promo_codes
+
+Revision ID: f1b6d83e4a20
+Revises: a48c6f19e2d7
+Create Date: 2026-10-18 15:58:31.640872
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1b6d83e4a20'
+down_revision = 'a48c6f19e2d7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('promo_codes', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('uses_count', sa.Integer(), server_default='0', nullable=False))
+
+    op.execute("""
+        UPDATE promo_codes
+        SET uses_count = (SELECT COUNT(*) FROM promo_code_uses WHERE promo_code_uses.promo_code_id = promo_codes.id)
+    """)
+
+
+def downgrade():
+    with op.batch_alter_table('promo_codes', schema=None) as batch_op:
+        batch_op.drop_column('uses_count')
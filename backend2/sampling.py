@@ -0,0 +1,49 @@
+import random
+
+
+class AliasSampler:
+    """
+    Walker's alias method (Vose's variant) for drawing from a fixed weighted list.
+    Building the table is O(n); every draw is O(1): one uniform bucket pick and one coin flip.
+    """
+
+    def __init__(self, items, weights):
+        pairs = [(item, float(w)) for item, w in zip(items, weights) if w and w > 0]
+        if not pairs:
+            raise ValueError("AliasSampler needs at least one item with a positive weight")
+        self.items = [item for item, _ in pairs]
+        n = len(pairs)
+        total = sum(w for _, w in pairs)
+        scaled = [w * n / total for _, w in pairs]
+
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Whatever is left is (up to rounding) exactly full
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    def __len__(self):
+        return len(self.items)
+
+    def sample(self, rng=random):
+        i = rng.randrange(len(self.items))
+        return self.items[i] if rng.random() < self.prob[i] else self.items[self.alias[i]]
+
+    def sample_many(self, k, rng=random):
+        """k independent draws in one pass."""
+        n = len(self.items)
+        items, prob, alias = self.items, self.prob, self.alias
+        out = []
+        for _ in range(k):
+            i = rng.randrange(n)
+            out.append(items[i] if rng.random() < prob[i] else items[alias[i]])
+        return out
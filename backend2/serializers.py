@@ -0,0 +1,71 @@
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import Date, DateTime, inspect as sa_inspect
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
+
+def camel_case(name):
+    head, *rest = name.split('_')
+    return head + ''.join(part.title() for part in rest)
+
+
+class ModelSerializer:
+    """
+    Model -> dict serializer compiled once per model into a single straight-line function:
+    each listed attribute is read once and keyed by its camelCase name (or `rename[field]`),
+    Date/DateTime columns become ISO strings, and `computed` adds key -> fn(obj) entries.
+    """
+
+    def __init__(self, model, fields, rename=None, computed=None):
+        rename = rename or {}
+        computed = dict(computed or {})
+        columns = {attr.key: attr.columns[0] for attr in sa_inspect(model).column_attrs}
+        body, items = [], []
+        for i, field in enumerate(fields):
+            key = rename.get(field, camel_case(field))
+            if isinstance(columns[field].type, (Date, DateTime)):
+                body.append(f"    v{i} = obj.{field}")
+                items.append(f"        {key!r}: v{i}.isoformat() if v{i} is not None else None,")
+            else:
+                items.append(f"        {key!r}: obj.{field},")
+        namespace = {}
+        for i, key in enumerate(computed):
+            namespace[f"_computed{i}"] = computed[key]
+            items.append(f"        {key!r}: _computed{i}(obj),")
+        source = "\n".join(["def serialize(obj):", *body, "    return {", *items, "    }"])
+        exec(compile(source, f"<serializer {model.__name__}>", "exec"), namespace)
+        self.model = model
+        self.source = source
+        self.serialize = namespace["serialize"]
+
+    def __call__(self, obj):
+        return self.serialize(obj)
+
+    def many(self, objs):
+        serialize = self.serialize
+        return [serialize(obj) for obj in objs]
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    app.json provider that encodes with orjson when it is installed. Output matches Flask's
+    default provider: sorted keys and datetimes rendered by DefaultJSONProvider.default.
+    """
+
+    if orjson is not None:
+        OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+        def dumps(self, obj, **kwargs):
+            if kwargs:
+                return super().dumps(obj, **kwargs)
+            return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode()
+
+        def response(self, *args, **kwargs):
+            if (self.compact is None and self._app.debug) or self.compact is False:
+                return super().response(*args, **kwargs)
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, default=self.default, option=self.OPTIONS | orjson.OPT_APPEND_NEWLINE)
+            return self._app.response_class(body, mimetype=self.mimetype)
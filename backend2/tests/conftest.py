@@ -0,0 +1,123 @@
+import contextvars
+import os
+import sys
+import tempfile
+
+import pytest
+from flask.testing import FlaskClient
+
+# The backend modules live next to app.py rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# DATABASE_URL picks the backend under test, e.g. postgresql+psycopg://localhost/mini_telegram_test.
+# The schema is created and dropped around the test session, so point it at a disposable database.
+# Unset, the tests run against a throwaway SQLite file.
+_scratch = tempfile.TemporaryDirectory()
+os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(_scratch.name, 'test.db'))
+
+import app as backend  # noqa: E402  (reads DATABASE_URL at import)
+
+
+class RequestContextClient(FlaskClient):
+    """
+    Runs every request outside the test's app context. Flask would otherwise reuse that
+    context, so g (current_user) and db.session would carry over from one request to the next.
+    """
+
+    def open(self, *args, **kwargs):
+        return contextvars.Context().run(super().open, *args, **kwargs)
+
+
+@pytest.fixture(scope='session')
+def app():
+    backend.app.config['TESTING'] = True
+    backend.app.test_client_class = RequestContextClient
+    backend.app.instance_path = _scratch.name  # spin log spool files
+    with backend.app.app_context():
+        backend.db.create_all()
+        yield backend.app
+        backend.db.session.remove()
+        backend.db.drop_all()
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """The per-process caches would otherwise carry rows between tests (rolled back or deleted)."""
+    backend.user_cache.clear()
+    backend.settings_cache.invalidate()
+    backend.prize_sampler.invalidate()
+    backend.promo_codes.invalidate()
+    yield
+
+
+@pytest.fixture
+def session(app):
+    """
+    db.session bound to one connection whose outer transaction is rolled back after the test.
+    The app's own commits and rollbacks become savepoints inside it, in the test and in requests.
+    """
+    engines = backend.db.engines
+    engine = engines[None]
+    connection = engine.connect()
+    dbapi_connection = connection.connection.dbapi_connection
+    if engine.dialect.name == 'sqlite':
+        # pysqlite defers BEGIN to the first DML statement, which would leave the reads and the
+        # savepoints before it outside the outer transaction; issue BEGIN explicitly instead
+        dbapi_connection.isolation_level = None
+        dbapi_connection.execute('BEGIN')
+    transaction = connection.begin()
+    backend.db.session.remove()
+    backend.db.session.session_factory.configure(join_transaction_mode='create_savepoint')
+    engines[None] = connection
+    try:
+        yield backend.db.session
+    finally:
+        backend.db.session.remove()
+        engines[None] = engine
+        transaction.rollback()
+        if engine.dialect.name == 'sqlite':
+            dbapi_connection.isolation_level = ''
+        connection.close()
+
+
+@pytest.fixture
+def committed(app):
+    """
+    db.session with real commits, for tests that need several connections or threads
+    (or a writer using db.engine directly). Every table is emptied afterwards.
+    """
+    backend.db.session.remove()
+    yield backend.db.session
+    backend.db.session.remove()
+    with backend.db.engine.begin() as conn:
+        for table in reversed(backend.db.metadata.sorted_tables):
+            conn.execute(table.delete())
+
+
+@pytest.fixture
+def client(session):
+    return backend.app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    """Creates and commits a User with the given column values (zero balances by default)."""
+    def make(**values):
+        values.setdefault('telegram_id', 1000 + backend.User.query.count())
+        values.setdefault('username', f"user{values['telegram_id']}")
+        for column in ('coins', 'spins', 'ton', 'ad_credit', 'referral_earnings'):
+            values.setdefault(column, 0)
+        user = backend.User(**values)
+        backend.db.session.add(user)
+        backend.db.session.commit()
+        return user
+    return make
+
+
+@pytest.fixture
+def login(client):
+    """Makes `user` the logged-in user of the test client."""
+    def login(user):
+        with client.session_transaction() as sess:
+            sess['user_id'] = user.id
+    return login
@@ -0,0 +1,155 @@
+import threading
+
+import pytest
+from flask import g, session as flask_session
+
+import app as backend
+from app import BalanceLedger, BalanceSnapshot, SystemSetting, User, db, ledger_balance
+
+
+def ledger_rows(sess, user_id):
+    """Ledger rows besides the 'opening' entry written when the user was created."""
+    return sess.query(BalanceLedger).filter(BalanceLedger.user_id == user_id,
+                                            BalanceLedger.reason != 'opening').count()
+
+
+def snapshot(app):
+    result = app.test_cli_runner().invoke(args=['snapshot-balances'])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+def watermark(sess):
+    return int(sess.query(SystemSetting.value).filter_by(key=backend.SNAPSHOT_WATERMARK_KEY).scalar())
+
+
+def test_snapshots_fold_only_entries_after_the_watermark(app, session, make_user):
+    user, other = make_user(coins=5), make_user(coins=7)
+    User.apply_balance(user.id, reason='spin', coins=3)
+    session.commit()
+    snapshot(app)
+    assert watermark(session) == session.query(db.func.max(BalanceLedger.id)).scalar()
+
+    User.apply_balance(other.id, reason='spin', coins=-2, spins=1)
+    session.commit()
+
+    assert "Snapshotted 1 user(s)" in snapshot(app)
+    assert "nothing to snapshot" in snapshot(app)
+    session.expire_all()
+    assert ledger_balance(user.id)['coins'] == 8
+    assert ledger_balance(other.id) == {'coins': 5, 'spins': 1, 'ton': 0, 'ad_credit': 0}
+    assert session.get(BalanceSnapshot, other.id).coins == 5
+
+
+def test_snapshots_from_before_the_watermark_are_not_folded_twice(app, session, make_user):
+    user = make_user(coins=5)
+    session.add(BalanceSnapshot(user_id=user.id, coins=5, spins=0, ton=0, ad_credit=0,
+                                last_entry_id=session.query(db.func.max(BalanceLedger.id)).scalar()))
+    session.commit()
+
+    snapshot(app)
+
+    session.expire_all()
+    assert session.get(BalanceSnapshot, user.id).coins == 5
+
+
+def test_debit_below_zero_is_refused_without_ledger_row(session, make_user):
+    user = make_user(coins=20)
+
+    assert not User.apply_balance(user.id, reason='withdrawal', coins=-21)
+    session.commit()
+
+    session.expire_all()
+    assert session.get(User, user.id).coins == 20
+    assert ledger_rows(session, user.id) == 0
+
+
+def test_guarded_debit_and_credit_append_one_ledger_row(session, make_user):
+    user = make_user(coins=20)
+
+    assert User.apply_balance(user.id, reason='spin', coins=-20, spins=3)
+    session.commit()
+
+    entry = session.query(BalanceLedger).filter_by(user_id=user.id, reason='spin').one()
+    assert (entry.coins, entry.spins, entry.reason) == (-20, 3, 'spin')
+
+
+@pytest.mark.parametrize('path', ['/user-campaigns', '/partner-tasks'])
+@pytest.mark.parametrize('body', [
+    {'link': 'https://t.me/somebot', 'goal': 10, 'cost': -5},
+    {'link': 'https://t.me/somebot', 'goal': 10, 'cost': 0},
+    {'link': 'https://t.me/somebot', 'goal': 0, 'cost': 1},
+    {'link': 'https://t.me/somebot', 'goal': 10, 'cost': 'free'},
+])
+def test_campaign_orders_need_positive_goal_and_cost(client, login, session, make_user, path, body):
+    user = make_user(ad_credit=3.0)
+    login(user)
+
+    resp = client.post(path, json=body)
+
+    assert resp.status_code == 400
+    session.expire_all()
+    assert session.get(User, user.id).ad_credit == 3.0
+    assert ledger_rows(session, user.id) == 0
+
+
+def test_campaign_order_beyond_ad_credit_is_refused(client, login, session, make_user):
+    user = make_user(ad_credit=3.0)
+    login(user)
+
+    resp = client.post('/user-campaigns', json={'link': 'https://t.me/somebot', 'goal': 10, 'cost': 5})
+
+    assert resp.status_code == 400
+    assert ledger_rows(session, user.id) == 0
+
+
+def test_retry_stale_reruns_view_after_concurrent_update(app, session, make_user):
+    user = make_user(coins=10)
+    session.refresh(user)
+    session.expunge(user)  # the request's copy, loaded at version 1
+    assert User.apply_balance(user.id, reason='spin', coins=1)  # another request's write
+    session.commit()
+    versions = []
+
+    @backend.retry_stale()
+    def view():
+        u = backend.current_user()
+        versions.append(u.version)
+        session.add(u)
+        u.coins = 50
+        session.commit()
+        return 'ok'
+
+    with app.test_request_context():
+        flask_session['user_id'] = user.id
+        g.current_user = user
+        assert view() == 'ok'
+
+    assert versions == [1, 2]
+    session.expire_all()
+    assert session.get(User, user.id).coins == 50
+
+
+def test_concurrent_debits_cannot_overdraw(app, committed, make_user):
+    user_id = make_user(coins=100).id
+    committed.rollback()  # end this session's read snapshot before the writers start
+    workers = 10
+    barrier = threading.Barrier(workers)
+    results = []
+
+    def debit():
+        with app.app_context():
+            barrier.wait()
+            ok = User.apply_balance(user_id, reason='withdrawal', coins=-30)
+            db.session.commit()
+            results.append(ok)
+
+    threads = [threading.Thread(target=debit) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results.count(True) == 3
+    assert committed.get(User, user_id).coins == 10
+    assert ledger_rows(committed, user_id) == 3
@@ -0,0 +1,55 @@
+from app import DailyTask
+
+
+def add_daily_task(sess, title='Check in', reward=10):
+    task = DailyTask(title=title, reward=reward, action='check_in', active=True)
+    sess.add(task)
+    sess.commit()
+    return task
+
+
+def test_matching_if_none_match_returns_304(client, login, session, make_user):
+    add_daily_task(session)
+    login(make_user())
+
+    first = client.get('/daily-tasks')
+    again = client.get('/daily-tasks', headers={'If-None-Match': first.headers['ETag']})
+
+    assert first.status_code == 200 and first.headers['ETag']
+    assert again.status_code == 304
+    assert again.data == b''
+    assert again.headers['ETag'] == first.headers['ETag']
+
+
+def test_claim_changes_the_etag(client, login, session, make_user):
+    task = add_daily_task(session)
+    login(make_user())
+    etag = client.get('/daily-tasks').headers['ETag']
+
+    assert client.post(f'/daily-tasks/{task.id}/claim').status_code == 200
+    resp = client.get('/daily-tasks', headers={'If-None-Match': etag})
+
+    assert resp.status_code == 200
+    assert resp.headers['ETag'] != etag
+    assert resp.get_json()[0]['claimed'] is True
+
+
+def test_catalog_change_changes_the_etag(client, login, session, make_user):
+    add_daily_task(session)
+    login(make_user())
+    etag = client.get('/daily-tasks').headers['ETag']
+
+    add_daily_task(session, title='Visit the channel')
+    resp = client.get('/daily-tasks', headers={'If-None-Match': etag})
+
+    assert resp.status_code == 200
+    assert len(resp.get_json()) == 2
+
+
+def test_etag_is_per_user(client, login, session, make_user):
+    add_daily_task(session)
+    login(make_user())
+    etag = client.get('/daily-tasks').headers['ETag']
+
+    login(make_user())
+    assert client.get('/daily-tasks', headers={'If-None-Match': etag}).status_code == 200
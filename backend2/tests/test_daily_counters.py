@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from app import User, counters_today
+
+
+def test_first_write_of_a_new_day_resets_every_counter(client, login, session, make_user):
+    yesterday = counters_today() - timedelta(days=1)
+    user = make_user(spins=0, ads_watched_today=50, tasks_completed_today_for_spin=7,
+                     friends_invited_today_for_spin=3, counters_day=yesterday)
+    login(user)
+
+    # Yesterday's values read as zero before anything is written today
+    assert client.get('/user').get_json()['adsWatchedToday'] == 0
+
+    resp = client.post('/spins/watch-ad')
+
+    assert resp.status_code == 200
+    session.expire_all()
+    user = session.get(User, user.id)
+    assert user.counters_day == counters_today()
+    assert (user.ads_watched_today, user.tasks_completed_today_for_spin, user.friends_invited_today_for_spin) == (1, 0, 0)
+    assert user.spins == 1
+
+
+def test_daily_cap_applies_within_the_same_day(client, login, session, make_user):
+    user = make_user(spins=0, ads_watched_today=49, counters_day=counters_today())
+    login(user)
+
+    assert client.post('/spins/watch-ad').status_code == 200
+    assert client.post('/spins/watch-ad').status_code == 400
+
+    session.expire_all()
+    user = session.get(User, user.id)
+    assert (user.ads_watched_today, user.spins) == (50, 1)
+
+
+def test_counter_without_a_day_starts_from_zero(client, login, session, make_user):
+    user = make_user(tasks_completed_today_for_spin=50, counters_day=None)
+    login(user)
+
+    assert client.post('/spins/complete-task').status_code == 200
+
+    session.expire_all()
+    assert session.get(User, user.id).tasks_completed_today_for_spin == 1
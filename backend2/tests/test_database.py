@@ -0,0 +1,50 @@
+"""Backend-specific paths (upserts, UPDATE ... RETURNING); run with DATABASE_URL for each backend."""
+import app as backend
+from app import SystemSetting, User, db
+
+
+def test_upsert_inserts_then_updates(session):
+    table = SystemSetting.__table__
+    for value in ('"hi"', '"hello"'):
+        backend.upsert(session, table, ['key'], dict(key='greeting', value=value, updated_at=backend.now()),
+                       dict(value=value))
+    session.commit()
+
+    rows = session.query(SystemSetting.value).filter_by(key='greeting').all()
+    assert rows == [('"hello"',)]
+
+
+def test_upsert_without_update_values_keeps_existing_row(session):
+    table = SystemSetting.__table__
+    for value in ('"first"', '"second"'):
+        backend.upsert(session, table, ['key'], dict(key='greeting', value=value, updated_at=backend.now()))
+    session.commit()
+
+    rows = session.query(SystemSetting.value).filter_by(key='greeting').all()
+    assert rows == [('"first"',)]
+
+
+def test_upsert_update_values_apply_only_on_conflict(session):
+    backend.increment_setting(session, 'COUNTER')
+    backend.increment_setting(session, 'COUNTER')
+    backend.increment_setting(session, 'COUNTER')
+    session.commit()
+
+    assert session.query(SystemSetting.value).filter_by(key='COUNTER').scalar() == '3'
+
+
+def test_apply_balance_refreshes_loaded_instance(session, make_user):
+    user = make_user(coins=100)
+
+    assert User.apply_balance(user.id, coins=-30, spins=2)
+    session.commit()
+
+    assert (user.coins, user.spins, user.version) == (70, 2, 2)
+    session.expire_all()
+    assert session.get(User, user.id).coins == 70
+
+
+def test_session_fixture_starts_empty(session):
+    # Runs after the tests above; their rows were rolled back with the outer transaction
+    assert session.query(User).count() == 0
+    assert db.session.query(SystemSetting).filter_by(key='COUNTER').count() == 0
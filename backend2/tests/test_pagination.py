@@ -0,0 +1,87 @@
+from datetime import timedelta
+
+import pytest
+
+from app import AdminUser, Transaction, encode_cursor, now
+
+
+@pytest.fixture
+def admin_headers(session):
+    admin = AdminUser(username='admin', password_hash='x', active=True)
+    session.add(admin)
+    session.commit()
+    return {'Authorization': f'Bearer mock_token_{admin.id}'}
+
+
+def walk(client, url, headers=None):
+    """Every page of `url`, following X-Next-Cursor; returns the pages' item ids."""
+    pages, cursor = [], None
+    while True:
+        resp = client.get(url + (f'&cursor={cursor}' if cursor else ''), headers=headers)
+        assert resp.status_code == 200
+        pages.append([item['id'] for item in resp.get_json()])
+        cursor = resp.headers.get('X-Next-Cursor')
+        if not cursor:
+            return pages
+
+
+def test_transaction_pages_neither_repeat_nor_skip(client, login, session, make_user):
+    user = make_user()
+    stamp = now()
+    # Runs of equal created_at values, so the id tiebreaker decides the page boundaries
+    session.add_all([
+        Transaction(user_id=user.id, type='Reward', amount=i, created_at=stamp - timedelta(minutes=i // 4))
+        for i in range(23)
+    ])
+    session.commit()
+    login(user)
+
+    pages = walk(client, '/transactions?limit=5')
+
+    ids = [i for page in pages for i in page]
+    assert [len(page) for page in pages] == [5, 5, 5, 5, 3]
+    expected = [t.id for t in session.query(Transaction)
+                .order_by(Transaction.created_at.desc(), Transaction.id.desc())]
+    assert ids == expected
+
+
+def test_rows_added_between_pages_do_not_shift_later_pages(client, login, session, make_user):
+    user = make_user()
+    session.add_all([Transaction(user_id=user.id, type='Reward', amount=i, created_at=now() - timedelta(seconds=i))
+                     for i in range(6)])
+    session.commit()
+    login(user)
+
+    first = client.get('/transactions?limit=3')
+    session.add(Transaction(user_id=user.id, type='Reward', amount=99, created_at=now()))
+    session.commit()
+    second = client.get(f"/transactions?limit=3&cursor={first.headers['X-Next-Cursor']}")
+
+    seen = [t['id'] for t in first.get_json() + second.get_json()]
+    assert len(set(seen)) == 6
+    assert 'X-Next-Cursor' not in second.headers
+
+
+def test_admin_users_sorted_by_a_balance_page_through_ties(client, session, make_user, admin_headers):
+    users = [make_user(coins=i % 3) for i in range(17)]  # many users share each balance
+
+    pages = walk(client, '/admin/users?sort=coins&limit=4', admin_headers)
+
+    ids = [i for page in pages for i in page]
+    assert ids == [u.id for u in sorted(users, key=lambda u: (u.coins, u.id), reverse=True)]
+
+
+@pytest.mark.parametrize('cursor', ['not-a-cursor', encode_cursor(['2026-01-01T00:00:00']), encode_cursor([1, 2, 3]),
+                                    encode_cursor(['yesterday', 5])])
+def test_bad_cursor_is_a_400(client, login, make_user, cursor):
+    login(make_user())
+
+    resp = client.get(f'/transactions?cursor={cursor}')
+
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "Invalid cursor"}
+
+
+def test_bad_cursor_is_a_400_on_admin_lists(client, admin_headers):
+    assert client.get('/admin/users?cursor=%%%', headers=admin_headers).status_code == 400
+    assert client.get('/admin/promo-codes?cursor=e30', headers=admin_headers).status_code == 400
@@ -0,0 +1,75 @@
+import threading
+
+from app import PromoCode, PromoCodeUse, User, db
+
+
+def make_code(sess, code='WELCOME', max_uses=2, value=100):
+    pc = PromoCode(code=code, type='COINS', value=value, max_uses=max_uses)
+    sess.add(pc)
+    sess.commit()
+    return pc
+
+
+def redeem(client, login, user, code):
+    login(user)
+    return client.post('/promo-codes/redeem', json={'code': code})
+
+
+def test_redeem_credits_once_per_user(client, login, session, make_user):
+    make_code(session, max_uses=5)
+    user = make_user()
+
+    first = redeem(client, login, user, ' welcome ')
+    second = redeem(client, login, user, 'WELCOME')
+
+    assert first.status_code == 200 and first.get_json()['user']['coins'] == 100
+    assert second.status_code == 400
+    assert second.get_json()['message'] == "You have already used this promo code."
+    session.expire_all()
+    assert session.get(User, user.id).coins == 100
+    assert session.query(PromoCodeUse).count() == 1
+
+
+def test_max_uses_is_not_exceeded(client, login, session, make_user):
+    pc = make_code(session, max_uses=2)
+    users = [make_user() for _ in range(3)]
+
+    statuses = [redeem(client, login, u, 'WELCOME').status_code for u in users]
+
+    assert statuses == [200, 200, 400]
+    session.expire_all()
+    assert session.get(PromoCode, pc.id).uses_count == 2
+    assert session.query(PromoCodeUse).count() == 2
+    assert session.get(User, users[2].id).coins == 0
+
+
+def test_unknown_code_is_rejected(client, login, session, make_user):
+    make_code(session)
+
+    assert redeem(client, login, make_user(), 'WELC0ME').status_code == 400
+
+
+def test_concurrent_redeems_cannot_exceed_max_uses(app, committed, make_user):
+    pc_id = make_code(committed, max_uses=3).id
+    user_ids = [make_user().id for _ in range(8)]
+    committed.rollback()
+    barrier = threading.Barrier(len(user_ids))
+    statuses = []
+
+    def redeem_as(user_id):
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['user_id'] = user_id
+        barrier.wait()
+        statuses.append(client.post('/promo-codes/redeem', json={'code': 'WELCOME'}).status_code)
+
+    threads = [threading.Thread(target=redeem_as, args=(user_id,)) for user_id in user_ids]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(statuses) == [200] * 3 + [400] * 5
+    assert committed.get(PromoCode, pc_id).uses_count == 3
+    assert committed.query(PromoCodeUse).count() == 3
+    assert db.session.query(User).filter(User.coins == 100).count() == 3
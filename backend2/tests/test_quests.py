@@ -0,0 +1,76 @@
+from sqlalchemy import event
+
+from app import PartnerTask, UserPartnerTask, db
+
+
+def add_partner_tasks(sess, owner, count):
+    tasks = [PartnerTask(title=f"Reach level {i}", reward=10, link=f"https://t.me/partner{i}_bot",
+                         required_level=5, created_by_user_id=owner.id) for i in range(count)]
+    sess.add_all(tasks)
+    sess.commit()
+    return tasks
+
+
+def count_statements(client, url):
+    """Statements run by a GET of `url` once the settings and catalog caches are warm."""
+    client.get(url)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        assert client.get(url).status_code == 200
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return len(statements)
+
+
+def partner_quests(resp):
+    return {q['id']: q for q in resp.get_json() if q['id'].startswith('q_partner_')}
+
+
+def test_partner_quests_carry_the_users_level(client, login, session, make_user):
+    user, other = make_user(), make_user()
+    first, second = add_partner_tasks(session, user, 2)
+    session.add_all([
+        UserPartnerTask(user_id=user.id, partner_task_id=first.id, current_level=3),
+        UserPartnerTask(user_id=other.id, partner_task_id=second.id, current_level=4),
+    ])
+    session.commit()
+    login(user)
+
+    quests = partner_quests(client.get('/quests'))
+
+    assert quests[f'q_partner_{first.id}']['currentProgress'] == 3
+    assert quests[f'q_partner_{second.id}']['currentProgress'] == 0
+    assert quests[f'q_partner_{first.id}']['totalProgress'] == 5
+
+
+def test_partner_progress_is_one_query_however_large_the_catalog(client, login, session, make_user):
+    user = make_user()
+    login(user)
+    add_partner_tasks(session, user, 3)
+    small = count_statements(client, '/quests')
+
+    tasks = add_partner_tasks(session, user, 40)
+    session.add_all([UserPartnerTask(user_id=user.id, partner_task_id=t.id, current_level=1) for t in tasks])
+    session.commit()
+    large = count_statements(client, '/quests')
+
+    assert large == small
+
+
+def test_progress_change_changes_the_quests_etag(client, login, session, make_user):
+    user = make_user()
+    task, = add_partner_tasks(session, user, 1)
+    login(user)
+    etag = client.get('/quests').headers['ETag']
+
+    session.add(UserPartnerTask(user_id=user.id, partner_task_id=task.id, current_level=2))
+    session.commit()
+    resp = client.get('/quests', headers={'If-None-Match': etag})
+
+    assert resp.status_code == 200
+    assert partner_quests(resp)[f'q_partner_{task.id}']['currentProgress'] == 2
@@ -0,0 +1,86 @@
+import random
+from collections import Counter
+
+import pytest
+
+from sampling import AliasSampler
+
+
+DRAWS = 100000
+# Chi-square critical values at p = 0.001, indexed by degrees of freedom
+CHI2_CRITICAL = {3: 16.266, 4: 18.467, 9: 27.877}
+
+
+def implied_probabilities(sampler):
+    """Exact per-item probability encoded by the prob/alias tables."""
+    n = len(sampler)
+    out = [0.0] * n
+    for i in range(n):
+        out[i] += sampler.prob[i] / n
+        out[sampler.alias[i]] += (1.0 - sampler.prob[i]) / n
+    return dict(zip(sampler.items, out))
+
+
+def chi_square(counts, weights, draws):
+    total = sum(weights.values())
+    return sum((counts.get(item, 0) - draws * w / total) ** 2 / (draws * w / total)
+               for item, w in weights.items())
+
+
+WEIGHTS = {'coins_10': 50, 'coins_50': 25, 'spins_1': 15, 'ton': 7, 'jackpot': 3}
+
+
+def test_tables_encode_the_weights_exactly():
+    sampler = AliasSampler(list(WEIGHTS), list(WEIGHTS.values()))
+    total = sum(WEIGHTS.values())
+    for item, p in implied_probabilities(sampler).items():
+        assert p == pytest.approx(WEIGHTS[item] / total, abs=1e-12)
+
+
+def test_sample_matches_weights():
+    sampler = AliasSampler(list(WEIGHTS), list(WEIGHTS.values()))
+    rng = random.Random(1234)
+    counts = Counter(sampler.sample(rng) for _ in range(DRAWS))
+    assert chi_square(counts, WEIGHTS, DRAWS) < CHI2_CRITICAL[len(WEIGHTS) - 1]
+
+
+def test_sample_many_matches_weights():
+    sampler = AliasSampler(list(WEIGHTS), list(WEIGHTS.values()))
+    draws = sampler.sample_many(DRAWS, random.Random(4321))
+    assert len(draws) == DRAWS
+    assert chi_square(Counter(draws), WEIGHTS, DRAWS) < CHI2_CRITICAL[len(WEIGHTS) - 1]
+
+
+def test_zero_and_missing_weights_are_never_drawn():
+    sampler = AliasSampler(['a', 'never', 'b', 'none', 'c', 'd'], [1, 0, 2, None, 3, 4])
+    assert sampler.items == ['a', 'b', 'c', 'd']
+    counts = Counter(sampler.sample_many(DRAWS, random.Random(7)))
+    assert 'never' not in counts and 'none' not in counts
+    assert chi_square(counts, {'a': 1, 'b': 2, 'c': 3, 'd': 4}, DRAWS) < CHI2_CRITICAL[3]
+
+
+def test_no_positive_weight_raises():
+    with pytest.raises(ValueError):
+        AliasSampler(['a', 'b'], [0, 0])
+    with pytest.raises(ValueError):
+        AliasSampler([], [])
+
+
+def test_rounding_leftovers_are_full_buckets():
+    # Weights that don't scale to exact binary fractions leave small/large entries
+    # at ~1.0 once pairing stops; those must become full buckets, not lose mass
+    weights = [0.1] * 7 + [1 / 3, 2 / 3, 0.3]
+    items = list(range(len(weights)))
+    sampler = AliasSampler(items, weights)
+    assert all(0.0 <= p <= 1.0 for p in sampler.prob)
+    assert all(0 <= a < len(items) for a in sampler.alias)
+    total = sum(weights)
+    for item, p in implied_probabilities(sampler).items():
+        assert p == pytest.approx(weights[item] / total, abs=1e-9)
+    counts = Counter(sampler.sample_many(DRAWS, random.Random(99)))
+    assert chi_square(counts, dict(zip(items, weights)), DRAWS) < CHI2_CRITICAL[9]
+
+
+def test_single_item_is_always_drawn():
+    sampler = AliasSampler(['only'], [5])
+    assert sampler.sample_many(100, random.Random(1)) == ['only'] * 100
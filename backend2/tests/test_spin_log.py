@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import app as backend
+from app import SpinResult, SpinResultLog, SpinWheelPrize, db
+
+
+@pytest.fixture
+def prize_id(committed):
+    prize = SpinWheelPrize(type='COINS', value=5, weight=1, label='5 coins')
+    committed.add(prize)
+    committed.commit()
+    return prize.id
+
+
+@pytest.fixture
+def spin_log(tmp_path, monkeypatch):
+    log = SpinResultLog('spool', batch_size=3, flush_ms=50, max_pending=1000,
+                        spool_dir=str(tmp_path), max_backoff_ms=200)
+    monkeypatch.setattr(backend, 'spin_log', log)
+    yield log
+    log.close()
+
+
+def spin_rows(user_id, prize_id, count):
+    return [{"user_id": user_id, "prize_id": prize_id, "spun_at": backend.now()} for _ in range(count)]
+
+
+def stored_spins(sess):
+    sess.rollback()  # read the writer thread's commits, not an older snapshot
+    return sess.query(SpinResult).count()
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out")
+        time.sleep(0.02)
+
+
+def spool_lines(log):
+    if not os.path.exists(log.spool_path):
+        return 0
+    with open(log.spool_path) as f:
+        return sum(1 for line in f if line.strip())
+
+
+def test_enqueued_rows_are_spooled_then_bulk_inserted(committed, make_user, prize_id, spin_log):
+    user_id = make_user().id
+
+    spin_log.enqueue(spin_rows(user_id, prize_id, 4))
+    assert spool_lines(spin_log) == 4
+
+    wait_for(lambda: stored_spins(committed) == 4)
+    wait_for(lambda: spool_lines(spin_log) == 0)
+
+
+def test_close_flushes_the_rest_and_removes_the_spool(committed, make_user, prize_id, spin_log):
+    spin_log.flush_interval = 60  # only close() writes a partial batch
+    spin_log.enqueue(spin_rows(make_user().id, prize_id, 2))
+
+    spin_log.close()
+
+    assert stored_spins(committed) == 2
+    assert not os.path.exists(spin_log.spool_path)
+
+
+def test_only_committed_spins_are_logged(committed, make_user, prize_id, spin_log):
+    user_id = make_user().id
+
+    spin_log.record(db.session, spin_rows(user_id, prize_id, 2))
+    db.session.rollback()
+    spin_log.record(db.session, spin_rows(user_id, prize_id, 1))
+    db.session.commit()
+    spin_log.close()
+
+    assert stored_spins(committed) == 1
+
+
+def test_replay_inserts_spool_files_of_dead_workers(app, committed, make_user, prize_id, spin_log):
+    dead = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'],
+                          capture_output=True, text=True, check=True)
+    path = os.path.join(spin_log.spool_dir, f"spin_results.{dead.stdout.strip()}.spool")
+    with open(path, 'w') as f:
+        f.writelines(backend._encode_spin_row(r) + "\n" for r in spin_rows(make_user().id, prize_id, 3))
+    # A live worker's file is left alone
+    spin_log.flush_interval = 60
+    spin_log.enqueue(spin_rows(make_user().id, prize_id, 1))
+
+    result = app.test_cli_runner().invoke(args=['replay-spin-spool'])
+
+    assert "Replayed 3 spin result(s)" in result.output
+    assert not os.path.exists(path)
+    assert os.path.exists(spin_log.spool_path)
+    assert stored_spins(committed) == 3
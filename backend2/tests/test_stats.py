@@ -0,0 +1,46 @@
+from sqlalchemy import func
+
+from app import StatsCounter, compute_dashboard_stats, db
+
+
+def shard_totals(sess):
+    row = sess.query(func.sum(StatsCounter.total_users), func.sum(StatsCounter.total_coins)).one()
+    return int(row[0] or 0), float(row[1] or 0)
+
+
+def test_reconcile_corrects_drift_without_replacing_shards(app, session, make_user):
+    make_user(coins=10)
+    make_user(coins=5)
+    session.query(StatsCounter).delete()
+    session.add_all([StatsCounter(shard=3, total_users=7, total_coins=1.0, total_withdrawals=0, tasks_completed=0)])
+    session.commit()
+
+    result = app.test_cli_runner().invoke(args=['reconcile-stats'])
+
+    assert result.exit_code == 0, result.output
+    session.expire_all()
+    assert shard_totals(session) == (2, 15.0)
+    assert session.get(StatsCounter, 3).total_users == 7  # live shards are left as they are
+    assert session.get(StatsCounter, 0).total_users == -5
+
+
+def test_reconcile_keeps_increments_written_after_it(app, session, make_user):
+    make_user(coins=3)
+    app.test_cli_runner().invoke(args=['reconcile-stats'])
+
+    make_user(coins=4)
+
+    session.expire_all()
+    assert shard_totals(session) == (2, 7.0)
+    assert compute_dashboard_stats()["total_coins"] == 7.0
+
+
+def test_reconcile_of_consistent_counters_is_a_no_op(app, session, make_user):
+    make_user(coins=2)
+    before = {s.shard: s.total_users for s in session.query(StatsCounter)}
+
+    result = app.test_cli_runner().invoke(args=['reconcile-stats'])
+
+    assert "corrections: none" in result.output
+    session.expire_all()
+    assert {s.shard: s.total_users for s in session.query(StatsCounter)} == before
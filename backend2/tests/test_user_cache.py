@@ -0,0 +1,54 @@
+from sqlalchemy import event, update
+
+from app import User, db
+
+
+def statements_during(fn):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    return result, statements
+
+
+def write_from_another_process(sess, user_id, **values):
+    """A committed change this process's user_cache is not told about."""
+    sess.execute(update(User).where(User.id == user_id).values(version=User.version + 1, **values))
+    sess.commit()
+
+
+def test_cache_hit_within_the_interval_skips_the_database(client, login, make_user):
+    login(make_user(coins=5))
+    client.get('/user/me')
+
+    resp, statements = statements_during(lambda: client.get('/user/me'))
+
+    assert resp.get_json()['coins'] == 5
+    assert statements == []
+
+
+def test_other_processes_writes_show_once_the_interval_passes(app, client, login, session, make_user, monkeypatch):
+    user = make_user(coins=5)
+    login(user)
+    client.get('/user/me')
+    write_from_another_process(session, user.id, coins=9)
+
+    assert client.get('/user/me').get_json()['coins'] == 5
+
+    monkeypatch.setitem(app.config, 'USER_CACHE_REVALIDATE_INTERVAL', 0)
+    assert client.get('/user/me').get_json()['coins'] == 9
+
+
+def test_own_writes_show_immediately(client, login, make_user):
+    login(make_user(spins=0))
+    client.get('/user')
+
+    assert client.post('/spins/watch-ad').status_code == 200
+
+    assert client.get('/user').get_json()['spins'] == 1